@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import wave
 
@@ -44,13 +45,20 @@ def _create_silent_wav(path: Path, duration_sec: float = 1.0, sample_rate: int =
         wf.setnchannels(n_channels)
         wf.setsampwidth(sampwidth)
         wf.setframerate(framerate)
-        # 無音なのですべて 0
-        wf.writeframes(b"\x00\x00" * n_frames)
+        # フレーム数を先に確定させておくと、close() 時のヘッダー書き戻しが不要になる
+        wf.setnframes(n_frames)
+        # 無音なのですべて 0 (ゼロ初期化済みバッファを一度に確保する)
+        wf.writeframesraw(bytes(n_channels * sampwidth * n_frames))
 
 
 def generate_demo_audio(audio_dir: Path) -> None:
-    _create_silent_wav(audio_dir / "001.wav", duration_sec=1.0)
-    _create_silent_wav(audio_dir / "002.wav", duration_sec=1.0)
+    # 2本のWAVは互いに独立しているのでスレッドで並行に書き出す
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(
+            _create_silent_wav,
+            (audio_dir / "001.wav", audio_dir / "002.wav"),
+            (1.0, 1.0),
+        ))
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -7,34 +7,50 @@
 """
 from __future__ import annotations
 
+import io
 import wave
-import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+SAMPLES_AUDIO_DIR = Path(__file__).parent.parent / "samples" / "basic_dialogue" / "audio"
 
-def generate_silent_wav(output_path: Path, duration_seconds: float = 2.0, sample_rate: int = 44100):
-    """無音のWAVファイルを生成"""
+# 10行分の音声ファイル（timeline.csv の各行に対応）と長さ(秒)
+SAMPLE_DURATIONS = (2.0, 1.5, 3.0, 2.0, 3.5, 2.5, 3.0, 2.0, 2.5, 2.0)
+EXPECTED_SAMPLE_WAVS = tuple(f"{i:03d}.wav" for i in range(1, len(SAMPLE_DURATIONS) + 1))
+
+
+@lru_cache(maxsize=None)
+def _silent_wav_bytes(duration_seconds: float, sample_rate: int) -> bytes:
+    """無音WAVファイルの内容 (ヘッダー込み) をメモリ上で組み立てる
+
+    サンプルセットは同じ長さのファイルを複数含むので、長さごとに一度だけ生成して使い回す。
+    """
     num_samples = int(sample_rate * duration_seconds)
+    buffer = io.BytesIO()
 
-    with wave.open(str(output_path), 'w') as wav_file:
+    with wave.open(buffer, 'wb') as wav_file:
         wav_file.setnchannels(1)  # モノラル
         wav_file.setsampwidth(2)  # 16bit
         wav_file.setframerate(sample_rate)
 
-        # 無音データ（全て0）
-        for _ in range(num_samples):
-            wav_file.writeframes(struct.pack('h', 0))
+        # 無音データ（全て0）。16bit モノラルなので 2バイト × サンプル数を一括で書き込む
+        wav_file.writeframes(bytes(2 * num_samples))
 
-    print(f"生成: {output_path} ({duration_seconds}秒)")
+    return buffer.getvalue()
+
+
+def generate_silent_wav(output_path: Path, duration_seconds: float = 2.0, sample_rate: int = 44100):
+    """無音のWAVファイルを生成"""
+    output_path.write_bytes(_silent_wav_bytes(duration_seconds, sample_rate))
 
 
 def main():
     """サンプル音声セットを生成"""
-    samples_dir = Path(__file__).parent.parent / "samples" / "basic_dialogue" / "audio"
+    samples_dir = SAMPLES_AUDIO_DIR
     samples_dir.mkdir(parents=True, exist_ok=True)
 
-    # 10行分の音声ファイルを生成（各2秒）
-    durations = [2.0, 1.5, 3.0, 2.0, 3.5, 2.5, 3.0, 2.0, 2.5, 2.0]
+    durations = SAMPLE_DURATIONS
 
     print("=" * 50)
     print("サンプル音声ファイル生成")
@@ -42,9 +58,14 @@ def main():
     print(f"出力先: {samples_dir}")
     print()
 
-    for i, duration in enumerate(durations, start=1):
-        output_path = samples_dir / f"{i:03d}.wav"
-        generate_silent_wav(output_path, duration)
+    output_paths = [samples_dir / name for name in EXPECTED_SAMPLE_WAVS]
+
+    # 各ファイルは独立しているのでスレッドで並行に書き出す (ログは入力順に出す)
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(generate_silent_wav, output_paths, durations))
+
+    for output_path, duration in zip(output_paths, durations):
+        print(f"生成: {output_path} ({duration}秒)")
 
     print()
     print("=" * 50)
@@ -13,6 +13,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import sys
+import wave
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -45,24 +46,27 @@ def _find_audio_files(audio_dir: Path) -> List[Path]:
     return sorted(set(files))
 
 
+def _probe_wav_duration(path: Path) -> float:
+    """WAV ヘッダーのフレーム数とサンプリングレートから長さ(秒)を求める"""
+    with wave.open(str(path), "rb") as wf:
+        frames = wf.getnframes()
+        framerate = wf.getframerate() or 1
+    return frames / float(framerate)
+
+
 def _build_audio_segments(audio_files: List[Path]) -> List[AudioInfo]:
     """音声ファイル一覧から AudioInfo リストを生成
 
     WAV ファイルのメタデータから duration を取得し、AudioInfo(file_path, duration) を構築する。
     それ以外の拡張子の場合は、現在はスキップする。
     """
-    import wave
-
     segments: List[AudioInfo] = []
     for path in audio_files:
         if path.suffix.lower() != ".wav":
             logger.warning(f"WAV 以外の拡張子はスキップします: {path}")
             continue
 
-        with wave.open(str(path), "rb") as wf:
-            frames = wf.getnframes()
-            framerate = wf.getframerate() or 1
-            duration = frames / float(framerate)
+        duration = _probe_wav_duration(path)
         segments.append(AudioInfo(file_path=path, duration=duration))
     return segments
 
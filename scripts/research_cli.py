@@ -3,6 +3,7 @@
 
 import argparse
 import asyncio
+import csv
 import json
 import os
 import sys
@@ -650,7 +651,6 @@ async def run_pipeline(
             stats.start_step("assemble")
             try:
                 from core.csv_assembler import CsvAssembler
-                import csv as csv_mod
 
                 # Orchestratorの再構築 (resume時/skip時)
                 if vis_package is None:
@@ -681,7 +681,7 @@ async def run_pipeline(
                         })
                 else:
                     with open(reviewed_csv, "r", encoding="utf-8") as f:
-                        for row in csv_mod.reader(f):
+                        for row in csv.reader(f):
                             if len(row) >= 2:
                                 assembled_segments.append({"speaker": row[0], "text": row[1]})
 
@@ -714,7 +714,6 @@ async def run_pipeline(
             state.save(work_dir)
             try:
                 from core.csv_assembler import CsvAssembler
-                import csv as csv_mod
 
                 assembler = CsvAssembler()
                 assembled_segments_fb: list[dict[str, str]] = []
@@ -726,7 +725,7 @@ async def run_pipeline(
                         })
                 else:
                     with open(reviewed_csv, "r", encoding="utf-8") as f:
-                        for row in csv_mod.reader(f):
+                        for row in csv.reader(f):
                             if len(row) >= 2:
                                 assembled_segments_fb.append({"speaker": row[0], "text": row[1]})
 
@@ -793,7 +792,6 @@ async def run_pipeline(
                 stats.start_step("assemble")
                 try:
                     from core.csv_assembler import CsvAssembler
-                    import csv as csv_mod
 
                     assembler = CsvAssembler()
                     assembled_segments_gen: list[dict[str, str]] = []
@@ -805,7 +803,7 @@ async def run_pipeline(
                             })
                     else:
                         with open(reviewed_csv, "r", encoding="utf-8") as f:
-                            for row in csv_mod.reader(f):
+                            for row in csv.reader(f):
                                 if len(row) >= 2:
                                     assembled_segments_gen.append({"speaker": row[0], "text": row[1]})
 
@@ -57,6 +57,7 @@ class IAssetRegistry(Protocol):
         """素材とメタデータを記録し再利用可能にする"""
 
 
+@runtime_checkable
 class ITimelinePlanner(Protocol):
     async def build_plan(
         self,
@@ -12,6 +12,9 @@ from pathlib import Path
 
 from config.settings import settings
 
+# 分割候補の区切り文字 (優先度順)
+_SPLIT_PUNCTUATION = ("。", "！", "？", "!", "?", "、", ",", " ", "\n")
+
 
 def expand_segment_into_slides(
     segment: Any,
@@ -102,12 +105,12 @@ def find_split_index(text: str, preferred_length: int) -> int:
         return len(text)
 
     search_window = min(len(text), preferred_length + 40)
-    slice_text = text[:search_window]
+    # preferred_length の 6 割未満の位置では分割しないので、そこから後ろだけを探索する
+    min_index = int(preferred_length * 0.6)
 
-    punctuation_patterns = ["。", "！", "？", "!", "?", "、", ",", " ", "\n"]
-    for pattern in punctuation_patterns:
-        idx = slice_text.rfind(pattern, 0, search_window)
-        if idx != -1 and idx >= int(preferred_length * 0.6):
+    for pattern in _SPLIT_PUNCTUATION:
+        idx = text.rfind(pattern, min_index, search_window)
+        if idx != -1:
             return idx + 1
 
     return preferred_length
@@ -15,10 +15,12 @@ AudioInfo が1本だけ、または与えられない場合は、テキスト文
 from __future__ import annotations
 
 import csv
+import io
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from core.utils.logger import logger
 from .audio_generator import AudioInfo
@@ -34,6 +36,49 @@ class CsvTimelineRow:
     text: str
 
 
+@lru_cache(maxsize=32)
+def _parse_csv_file(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    """CSV をパースして (話者, テキスト) のタプル列を返す
+
+    mtime_ns / size はキャッシュキーとしてのみ使用する（ファイル更新時に再パースさせるため）。
+    """
+    rows: List[Tuple[str, str]] = []
+
+    # ファイルは一度にまとめて読み込む（セル内改行を保つため改行変換はしない）
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        content = f.read()
+
+    raw_rows: Iterable[List[str]]
+    if '"' in content:
+        # クォートを含む場合はセル内改行などに備えて csv モジュールでパース
+        raw_rows = csv.reader(io.StringIO(content, newline=""))
+    else:
+        # クォートなしの台本CSVは行分割 + カンマ分割で十分
+        lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        raw_rows = (line.split(",") for line in lines)
+
+    for raw_row in raw_rows:
+        # 空行スキップ
+        if not raw_row or not any(col.strip() for col in raw_row):
+            continue
+
+        if len(raw_row) < 2:
+            logger.debug(f"列数不足の行をスキップ: {raw_row}")
+            continue
+
+        speaker = raw_row[0].strip()
+        text = raw_row[1].strip()
+
+        if not text:
+            # テキストが空の行はスキップ
+            logger.debug(f"テキストが空の行をスキップ: {raw_row}")
+            continue
+
+        rows.append((speaker, text))
+
+    return tuple(rows)
+
+
 class CsvTranscriptLoader:
     """CSV から TranscriptInfo を生成するローダー"""
 
@@ -111,33 +156,16 @@ class CsvTranscriptLoader:
 
         - 空行は無視
         - 列数が2未満の行は無視
-        """
-        rows: List[CsvTimelineRow] = []
-
-        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
-            reader = csv.reader(f)
-            index = 1
-            for raw_row in reader:
-                # 空行スキップ
-                if not raw_row or not any(col.strip() for col in raw_row):
-                    continue
-
-                if len(raw_row) < 2:
-                    logger.debug(f"列数不足の行をスキップ: {raw_row}")
-                    continue
 
-                speaker = raw_row[0].strip()
-                text = raw_row[1].strip()
-
-                if not text:
-                    # テキストが空の行はスキップ
-                    logger.debug(f"テキストが空の行をスキップ: {raw_row}")
-                    continue
-
-                rows.append(CsvTimelineRow(index=index, speaker=speaker, text=text))
-                index += 1
-
-        return rows
+        パース結果は (パス, mtime, サイズ) 単位でキャッシュされるため、
+        同じ CSV を複数フェーズから読み込んでも再パースは発生しない。
+        """
+        stat = csv_path.stat()
+        parsed = _parse_csv_file(str(csv_path), stat.st_mtime_ns, stat.st_size)
+        return [
+            CsvTimelineRow(index=index, speaker=speaker, text=text)
+            for index, (speaker, text) in enumerate(parsed, start=1)
+        ]
 
     def _assign_timings(
         self,
@@ -6,12 +6,29 @@ import asyncio
 from config.settings import settings
 from tests.api_test_data import get_test_sources, get_test_slides_content
 
+# (環境変数名, サービス名, 判定関数)。同じサービス名の項目はすべて揃って初めて「設定済み」
+CREDENTIAL_CHECKS = (
+    ("GEMINI_API_KEY", "gemini", lambda s: s.GEMINI_API_KEY),
+    ("OPENAI_API_KEY", "openai", lambda s: s.OPENAI_API_KEY),
+    ("ELEVENLABS_API_KEY", "elevenlabs",
+     lambda s: s.TTS_SETTINGS.get("elevenlabs", {}).get("api_key", "")),
+    ("AZURE_SPEECH_KEY", "azure_speech", lambda s: s.TTS_SETTINGS.get("azure", {}).get("key", "")),
+    ("AZURE_SPEECH_REGION", "azure_speech",
+     lambda s: s.TTS_SETTINGS.get("azure", {}).get("region", "")),
+    ("YOUTUBE_CLIENT_ID", "youtube", lambda s: s.YOUTUBE_CLIENT_ID),
+    ("YOUTUBE_CLIENT_SECRET", "youtube", lambda s: s.YOUTUBE_CLIENT_SECRET),
+    ("GOOGLE_CLIENT_SECRETS_FILE", "google_oauth",
+     lambda s: getattr(s, "GOOGLE_CLIENT_SECRETS_FILE", None) and s.GOOGLE_CLIENT_SECRETS_FILE.exists()),
+)
+
 
 class APIIntegrationTest:
     """API統合テストクラス"""
 
     def __init__(self):
         self.test_results = {}
+        # test_api_keys で一度だけ判定した認証情報の有無 (後続テストのスキップ判定に再利用)
+        self._creds: dict = {}
 
     async def run_all_tests(self):
         """全APIテストを実行"""
@@ -45,39 +62,14 @@ class APIIntegrationTest:
         print("-" * 40)
 
         try:
-            status = {
-                "gemini": bool(settings.GEMINI_API_KEY),
-                "openai": bool(settings.OPENAI_API_KEY),
-                "elevenlabs": bool(settings.TTS_SETTINGS.get("elevenlabs", {}).get("api_key", "")),
-                "azure_speech": bool(settings.TTS_SETTINGS.get("azure", {}).get("key", ""))
-                and bool(settings.TTS_SETTINGS.get("azure", {}).get("region", "")),
-                "youtube": bool(settings.YOUTUBE_CLIENT_ID and settings.YOUTUBE_CLIENT_SECRET),
-                "google_oauth": bool(
-                    getattr(settings, "GOOGLE_CLIENT_SECRETS_FILE", None)
-                    and settings.GOOGLE_CLIENT_SECRETS_FILE.exists()
-                ),
-            }
+            checked = [(key_name, service, bool(predicate(settings)))
+                       for key_name, service, predicate in CREDENTIAL_CHECKS]
+            status = {}
+            for _, service, present in checked:
+                status[service] = status.get(service, True) and present
+            missing = [key_name for key_name, _, present in checked if not present]
 
-            missing = []
-            if not settings.GEMINI_API_KEY:
-                missing.append("GEMINI_API_KEY")
-            if not settings.OPENAI_API_KEY:
-                missing.append("OPENAI_API_KEY")
-            if not settings.TTS_SETTINGS.get("elevenlabs", {}).get("api_key", ""):
-                missing.append("ELEVENLABS_API_KEY")
-            if not settings.TTS_SETTINGS.get("azure", {}).get("key", ""):
-                missing.append("AZURE_SPEECH_KEY")
-            if not settings.TTS_SETTINGS.get("azure", {}).get("region", ""):
-                missing.append("AZURE_SPEECH_REGION")
-            if not settings.YOUTUBE_CLIENT_ID:
-                missing.append("YOUTUBE_CLIENT_ID")
-            if not settings.YOUTUBE_CLIENT_SECRET:
-                missing.append("YOUTUBE_CLIENT_SECRET")
-            if not (
-                getattr(settings, "GOOGLE_CLIENT_SECRETS_FILE", None)
-                and settings.GOOGLE_CLIENT_SECRETS_FILE.exists()
-            ):
-                missing.append("GOOGLE_CLIENT_SECRETS_FILE")
+            self._creds = status
 
             print("📊 API認証状況:")
             for service, available in status.items():
@@ -108,7 +100,7 @@ class APIIntegrationTest:
         try:
             from notebook_lm.gemini_integration import GeminiIntegration
 
-            if not settings.GEMINI_API_KEY:
+            if not self._creds.get("gemini"):
                 print("⚠️ Gemini APIキーが設定されていません")
                 self.test_results["gemini"] = {"status": "skipped", "reason": "no_api_key"}
                 return
@@ -164,7 +156,7 @@ class APIIntegrationTest:
         try:
             from youtube.uploader import YouTubeUploader
 
-            if not (settings.YOUTUBE_CLIENT_ID and settings.YOUTUBE_CLIENT_SECRET):
+            if not self._creds.get("youtube"):
                 print("⚠️ YouTube API認証情報が設定されていません")
                 self.test_results["youtube"] = {"status": "skipped", "reason": "no_credentials"}
                 return
@@ -211,10 +203,7 @@ class APIIntegrationTest:
         try:
             from slides.slide_generator import SlideGenerator
 
-            if not (
-                getattr(settings, "GOOGLE_CLIENT_SECRETS_FILE", None)
-                and settings.GOOGLE_CLIENT_SECRETS_FILE.exists()
-            ):
+            if not self._creds.get("google_oauth"):
                 print("⚠️ Google Slides API認証ファイルが設定されていません")
                 self.test_results["slides"] = {"status": "skipped", "reason": "no_credentials_file"}
                 return
@@ -1,9 +1,12 @@
 """Shared pytest fixtures and configuration."""
 
+import importlib.util
 import sys
 import types
 from unittest.mock import MagicMock
 
+import pytest
+
 
 def _ensure_google_genai_mockable() -> None:
     """Ensure google.genai module path is resolvable for unittest.mock.patch.
@@ -16,11 +19,12 @@ def _ensure_google_genai_mockable() -> None:
     If the real SDK is installed, this function does nothing — the real
     module is already importable and patchable.
     """
-    try:
-        import google.genai  # noqa: F401 — real SDK available
-        return
-    except (ImportError, ModuleNotFoundError):
-        pass
+    # find_spec on a dotted name imports the parent, so check "google" first
+    if (
+        importlib.util.find_spec("google") is not None
+        and importlib.util.find_spec("google.genai") is not None
+    ):
+        return  # real SDK available
 
     if "google" not in sys.modules:
         google_pkg = types.ModuleType("google")
@@ -36,3 +40,47 @@ def _ensure_google_genai_mockable() -> None:
 
 # Run once at import time (before any test collection)
 _ensure_google_genai_mockable()
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """TestClient for src.server.api.app, shared across the whole session.
+
+    Building a TestClient (and entering its lifespan) once per session keeps
+    per-test setup down to resetting the in-memory stores, which the
+    module-level ``client`` fixtures do themselves.
+    """
+    pytest.importorskip("fastapi", reason="fastapi not installed")
+    from fastapi.testclient import TestClient
+    from src.server.api import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def mock_sources():
+    """Two SourceInfo records shared by the script provider tests.
+
+    Providers only read the sources, so one list per session is enough.
+    """
+    from notebook_lm.source_collector import SourceInfo
+
+    return [
+        SourceInfo(
+            url="https://example.com/article1",
+            title="Test Article 1",
+            content_preview="This is test content 1",
+            relevance_score=0.9,
+            reliability_score=0.8,
+            source_type="article"
+        ),
+        SourceInfo(
+            url="https://example.com/article2",
+            title="Test Article 2",
+            content_preview="This is test content 2",
+            relevance_score=0.7,
+            reliability_score=0.9,
+            source_type="news"
+        ),
+    ]
@@ -1,6 +1,8 @@
 """
 デモ実行クラス
 """
+import os
+from operator import itemgetter
 from pathlib import Path
 
 from config.settings import settings, create_directories
@@ -14,6 +16,31 @@ from .demo_data import (
     get_mock_upload_result,
 )
 
+# (閾値, 単位)。閾値を超えた最初の単位で表示し、どれにも当たらなければバイト表示
+_SIZE_UNITS = ((1 << 20, "MB"), (1 << 10, "KB"))
+
+
+def _format_size(size: int) -> str:
+    """ファイルサイズを人間が読みやすい文字列に変換"""
+    for threshold, unit in _SIZE_UNITS:
+        if size > threshold:
+            return f"{size / threshold:.1f}{unit}"
+    return f"{size}B"
+
+
+def _scandir_files(path):
+    """ディレクトリ配下のファイルを再帰的に列挙する (シンボリックリンクは辿らない)
+
+    os.scandir の DirEntry を返すので、呼び出し側は is_file()/stat() を
+    追加の stat 呼び出しなしで利用できる。
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
 
 class DemoRunner:
     """デモ実行クラス"""
@@ -149,30 +176,29 @@ class DemoRunner:
         print("\n📁 【成果物一覧】")
         print("-" * 40)
 
+        project_root = str(Path(__file__).resolve().parent.parent)
+        data_dir = settings.DATA_DIR
+        sub_dirs = [str(d) for d in (settings.AUDIO_DIR, settings.SLIDES_DIR,
+                                     settings.VIDEOS_DIR, settings.TRANSCRIPTS_DIR)]
+
         output_files = []
 
         # データディレクトリ内のファイルをチェック
-        for directory in [settings.DATA_DIR, settings.AUDIO_DIR, settings.SLIDES_DIR,
-                         settings.VIDEOS_DIR, settings.TRANSCRIPTS_DIR]:
-            if directory.exists():
-                for file_path in directory.rglob("*"):
-                    if file_path.is_file():
-                        size = file_path.stat().st_size
-                        output_files.append((file_path, size))
+        for directory in [str(data_dir), *sub_dirs]:
+            # 存在確認の stat を省き、opendir の失敗で未作成ディレクトリを判定する
+            try:
+                for entry in _scandir_files(directory):
+                    output_files.append((entry.path, entry.stat().st_size))
+            except FileNotFoundError:
+                continue
 
         if output_files:
             print("📄 生成されたファイル:")
             total_size = 0
-            for file_path, size in sorted(output_files):
-                relative_path = file_path.relative_to(Path(__file__).parent.parent)
-                if size > 1024 * 1024:
-                    size_str = f"{size/1024/1024:.1f}MB"
-                elif size > 1024:
-                    size_str = f"{size/1024:.1f}KB"
-                else:
-                    size_str = f"{size}B"
-
-                print(f"  📄 {relative_path} ({size_str})")
+            output_files.sort(key=itemgetter(0))
+            for file_path, size in output_files:
+                relative_path = os.path.relpath(file_path, project_root)
+                print(f"  📄 {relative_path} ({_format_size(size)})")
                 total_size += size
 
             print(f"\n💾 総ファイルサイズ: {total_size/1024/1024:.1f}MB")
@@ -181,8 +207,11 @@ class DemoRunner:
 
         # ディレクトリ構造を表示
         print("\n📂 ディレクトリ構造:")
-        print(f"  📁 {settings.DATA_DIR.name}/")
-        for subdir in [settings.AUDIO_DIR, settings.SLIDES_DIR, settings.VIDEOS_DIR, settings.TRANSCRIPTS_DIR]:
-            if subdir.exists():
-                file_count = len(list(subdir.glob("*")))
-                print(f"    📁 {subdir.name}/ ({file_count}ファイル)")
+        print(f"  📁 {data_dir.name}/")
+        for subdir in sub_dirs:
+            try:
+                with os.scandir(subdir) as it:
+                    file_count = sum(1 for _ in it)
+            except FileNotFoundError:
+                continue
+            print(f"    📁 {os.path.basename(subdir)}/ ({file_count}ファイル)")
@@ -40,14 +40,14 @@ class _FakeFile:
 # ---------------------------------------------------------------------------
 
 @pytest.fixture()
-def client():
-    """Create a fresh TestClient, resetting in-memory stores."""
-    from src.server.api import app, RUNS, ARTIFACTS, PROGRESS
+def client(api_client: TestClient):
+    """Session-shared TestClient with the in-memory stores reset."""
+    from src.server.api import RUNS, ARTIFACTS, PROGRESS
 
     RUNS.clear()
     ARTIFACTS.clear()
     PROGRESS.clear()
-    return TestClient(app)
+    return api_client
 
 
 # ---------------------------------------------------------------------------
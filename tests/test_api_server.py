@@ -45,15 +45,13 @@ class TestHealth:
         assert "checks" in body
         assert "timestamp" in body
 
-    def test_health_check_database(self, server_instance):
+    async def test_health_check_database(self, server_instance):
         """Database check always returns healthy (file-based)."""
-        import asyncio
-        result = asyncio.get_event_loop().run_until_complete(server_instance.check_database())
+        result = await server_instance.check_database()
         assert result["status"] == "healthy"
 
-    def test_health_check_file_system(self, server_instance, tmp_path: Path):
+    async def test_health_check_file_system(self, server_instance, tmp_path: Path):
         """File system check passes when dirs exist and are writable."""
-        import asyncio
         with patch("src.server.api_server.settings") as mock_settings:
             mock_settings.DATA_DIR = tmp_path
             mock_settings.VIDEOS_DIR = tmp_path / "videos"
@@ -61,50 +59,45 @@ class TestHealth:
             mock_settings.SLIDES_DIR = tmp_path / "slides"
             for d in [mock_settings.VIDEOS_DIR, mock_settings.AUDIO_DIR, mock_settings.SLIDES_DIR]:
                 d.mkdir()
-            result = asyncio.get_event_loop().run_until_complete(server_instance.check_file_system())
+            result = await server_instance.check_file_system()
             assert result["status"] == "healthy"
 
-    def test_health_check_file_system_missing_dir(self, server_instance, tmp_path: Path):
+    async def test_health_check_file_system_missing_dir(self, server_instance, tmp_path: Path):
         """File system check fails when directory is missing."""
-        import asyncio
         with patch("src.server.api_server.settings") as mock_settings:
             mock_settings.DATA_DIR = tmp_path
             mock_settings.VIDEOS_DIR = tmp_path / "nonexistent"
             mock_settings.AUDIO_DIR = tmp_path / "audio"
             mock_settings.SLIDES_DIR = tmp_path / "slides"
-            result = asyncio.get_event_loop().run_until_complete(server_instance.check_file_system())
+            result = await server_instance.check_file_system()
             assert result["status"] == "unhealthy"
 
-    def test_health_check_api_keys_configured(self, server_instance):
+    async def test_health_check_api_keys_configured(self, server_instance):
         """API keys check returns healthy when keys are set."""
-        import asyncio
         with patch("src.server.api_server.settings") as mock_settings:
             mock_settings.PIPELINE_COMPONENTS = {"script_provider": "gemini"}
             mock_settings.GEMINI_API_KEY = "test_key"
-            result = asyncio.get_event_loop().run_until_complete(server_instance.check_api_keys())
+            result = await server_instance.check_api_keys()
             assert result["status"] == "healthy"
 
-    def test_health_check_api_keys_missing(self, server_instance):
+    async def test_health_check_api_keys_missing(self, server_instance):
         """API keys check warns when required key is missing."""
-        import asyncio
         with patch("src.server.api_server.settings") as mock_settings:
             mock_settings.PIPELINE_COMPONENTS = {"script_provider": "gemini"}
             mock_settings.GEMINI_API_KEY = ""
-            result = asyncio.get_event_loop().run_until_complete(server_instance.check_api_keys())
+            result = await server_instance.check_api_keys()
             assert result["status"] == "warning"
 
-    def test_health_check_pipeline_success(self, server_instance):
+    async def test_health_check_pipeline_success(self, server_instance):
         """Pipeline check succeeds when build_default_pipeline works."""
-        import asyncio
         with patch("src.server.api_server.build_default_pipeline", return_value=MagicMock()):
-            result = asyncio.get_event_loop().run_until_complete(server_instance.check_pipeline())
+            result = await server_instance.check_pipeline()
             assert result["status"] == "healthy"
 
-    def test_health_check_pipeline_failure(self, server_instance):
+    async def test_health_check_pipeline_failure(self, server_instance):
         """Pipeline check fails when build raises."""
-        import asyncio
         with patch("src.server.api_server.build_default_pipeline", side_effect=ImportError("missing")):
-            result = asyncio.get_event_loop().run_until_complete(server_instance.check_pipeline())
+            result = await server_instance.check_pipeline()
             assert result["status"] == "unhealthy"
 
 
@@ -228,9 +221,8 @@ class TestHelpers:
         """Should not raise even with mock metrics."""
         server_instance._increment_request_count("GET", "/test", "200")
 
-    def test_perform_cleanup(self, server_instance, tmp_path: Path):
+    async def test_perform_cleanup(self, server_instance, tmp_path: Path):
         """Cleanup deletes old files."""
-        import asyncio
         with patch("src.server.api_server.settings") as mock_settings:
             cleanup_dir = tmp_path / "videos"
             cleanup_dir.mkdir()
@@ -244,12 +236,11 @@ class TestHelpers:
             mock_settings.SLIDES_DIR = tmp_path / "slides"
             mock_settings.SCRIPTS_DIR = tmp_path / "scripts"
 
-            asyncio.get_event_loop().run_until_complete(server_instance.perform_cleanup(1))
+            await server_instance.perform_cleanup(1)
             assert not old_file.exists()
 
-    def test_perform_cleanup_oserror(self, server_instance, tmp_path: Path):
+    async def test_perform_cleanup_oserror(self, server_instance, tmp_path: Path):
         """Cleanup handles OSError gracefully."""
-        import asyncio
         with patch("src.server.api_server.settings") as mock_settings:
             mock_settings.VIDEOS_DIR = MagicMock()
             mock_settings.VIDEOS_DIR.glob.side_effect = OSError("permission denied")
@@ -257,37 +248,33 @@ class TestHelpers:
             mock_settings.SLIDES_DIR = tmp_path / "slides"
             mock_settings.SCRIPTS_DIR = tmp_path / "scripts"
             # Should not raise
-            asyncio.get_event_loop().run_until_complete(server_instance.perform_cleanup(1))
+            await server_instance.perform_cleanup(1)
 
-    def test_check_file_system_oserror(self, server_instance):
+    async def test_check_file_system_oserror(self, server_instance):
         """File system check handles OSError."""
-        import asyncio
         with patch("src.server.api_server.settings") as mock_settings:
             mock_settings.DATA_DIR = MagicMock()
             mock_settings.DATA_DIR.exists.side_effect = OSError("bad path")
-            result = asyncio.get_event_loop().run_until_complete(server_instance.check_file_system())
+            result = await server_instance.check_file_system()
             assert result["status"] == "unhealthy"
 
-    def test_check_file_system_generic_exception(self, server_instance):
+    async def test_check_file_system_generic_exception(self, server_instance):
         """File system check handles generic exception."""
-        import asyncio
         with patch("src.server.api_server.settings") as mock_settings:
             mock_settings.DATA_DIR = MagicMock()
             mock_settings.DATA_DIR.exists.side_effect = RuntimeError("unexpected")
-            result = asyncio.get_event_loop().run_until_complete(server_instance.check_file_system())
+            result = await server_instance.check_file_system()
             assert result["status"] == "unhealthy"
 
-    def test_check_pipeline_generic_exception(self, server_instance):
+    async def test_check_pipeline_generic_exception(self, server_instance):
         """Pipeline check handles generic exception."""
-        import asyncio
         with patch("src.server.api_server.build_default_pipeline", side_effect=RuntimeError("boom")):
-            result = asyncio.get_event_loop().run_until_complete(server_instance.check_pipeline())
+            result = await server_instance.check_pipeline()
             assert result["status"] == "unhealthy"
 
-    def test_metrics_prometheus_not_available(self, server_instance):
+    def test_metrics_prometheus_not_available(self, client: TestClient):
         """Metrics endpoint when prometheus is not available."""
         with patch("src.server.api_server.PROMETHEUS_AVAILABLE", False):
-            client = TestClient(server_instance.app)
             resp = client.get("/metrics")
             assert resp.status_code == 200
             assert "Prometheus not available" in resp.text
@@ -2,13 +2,8 @@
 基本テストファイル
 プロジェクトの基本機能をテスト
 """
+import importlib
 import pytest
-from pathlib import Path
-import sys
-
-# プロジェクトルートをパスに追加
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
 
 from config.settings import settings, create_directories
 
@@ -46,34 +41,21 @@ class TestBasicSetup:
 class TestModuleImports:
     """モジュールインポートのテスト"""
 
-    def test_notebook_lm_imports(self):
-        """NotebookLMモジュールのインポートテスト"""
-        from notebook_lm import SourceInfo, AudioGenerator, TranscriptProcessor
-
-        assert SourceInfo is not None
-        assert AudioGenerator is not None
-        assert TranscriptProcessor is not None
-
-    def test_slides_imports(self):
-        """スライドモジュールのインポートテスト"""
-        from slides import SlideGenerator, ContentSplitter
-
-        assert SlideGenerator is not None
-        assert ContentSplitter is not None
-
-    def test_video_editor_imports(self):
-        """動画編集モジュールのインポートテスト"""
-        from video_editor import VideoInfo, ThumbnailInfo
-
-        assert VideoInfo is not None
-        assert ThumbnailInfo is not None
-
-    def test_youtube_imports(self):
-        """YouTubeモジュールのインポートテスト"""
-        from youtube import YouTubeUploader, MetadataGenerator
-
-        assert YouTubeUploader is not None
-        assert MetadataGenerator is not None
+    @pytest.mark.parametrize(
+        "module_name, names",
+        [
+            ("notebook_lm", ("SourceInfo", "AudioGenerator", "TranscriptProcessor")),
+            ("slides", ("SlideGenerator", "ContentSplitter")),
+            ("video_editor", ("VideoInfo", "ThumbnailInfo")),
+            ("youtube", ("YouTubeUploader", "MetadataGenerator")),
+        ],
+    )
+    def test_package_imports(self, module_name, names):
+        """各パッケージが公開名をエクスポートしているか"""
+        module = importlib.import_module(module_name)
+
+        for name in names:
+            assert getattr(module, name, None) is not None, f"{module_name}.{name}"
 
 class TestDataStructures:
     """データ構造のテスト"""
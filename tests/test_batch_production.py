@@ -3,12 +3,8 @@ import json
 import pytest
 from pathlib import Path
 from unittest.mock import patch, AsyncMock, MagicMock
-import sys
 import asyncio
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from scripts.research_cli import run_batch
 
 
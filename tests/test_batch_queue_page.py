@@ -3,22 +3,17 @@
 streamlit がテスト環境にない場合はスキップ。
 ロジック関数のみをテストする。
 """
+import importlib.util
 import json
 import pytest
 from pathlib import Path
 from unittest.mock import patch, AsyncMock, MagicMock
 import sys
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 # streamlit が無ければ全スキップ
 st_mock = MagicMock()
-try:
-    import streamlit  # noqa: F401
-    HAS_STREAMLIT = True
-except ImportError:
-    HAS_STREAMLIT = False
+HAS_STREAMLIT = importlib.util.find_spec("streamlit") is not None
+if not HAS_STREAMLIT:
     sys.modules["streamlit"] = st_mock
 
 pytestmark = pytest.mark.skipif(
@@ -1,15 +1,8 @@
 #!/usr/bin/env python3
 """CSV台本ローダーのテスト"""
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# プロジェクトルートをパスに追加
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
 from notebook_lm.csv_transcript_loader import CsvTranscriptLoader
 from notebook_lm.audio_generator import AudioInfo
 
@@ -184,3 +177,18 @@ async def test_heuristic_total_audio_no_duration(tmp_path):
 
     assert len(transcript.segments) == 2
     assert transcript.total_duration > 0
+
+
+@pytest.mark.asyncio
+async def test_reload_after_csv_is_modified(tmp_path):
+    """同じパスの CSV を書き換えた場合、キャッシュではなく新しい内容が読まれる。"""
+    csv_path = tmp_path / "modified.csv"
+    csv_path.write_text("A,最初のテキスト\n", encoding="utf-8")
+
+    loader = CsvTranscriptLoader()
+    first = await loader.load_from_csv(csv_path)
+    assert [seg.text for seg in first.segments] == ["最初のテキスト"]
+
+    csv_path.write_text("A,更新後\nB,追加行\n", encoding="utf-8")
+    second = await loader.load_from_csv(csv_path)
+    assert [seg.text for seg in second.segments] == ["更新後", "追加行"]
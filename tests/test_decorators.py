@@ -1,11 +1,18 @@
 """retry_on_failure デコレータテスト"""
-import asyncio
+from unittest.mock import AsyncMock, call, patch
 
 import pytest
 
 from core.utils.decorators import retry_on_failure
 
 
+@pytest.fixture(autouse=True)
+def mock_sleep():
+    """バックオフ待機を実際には行わない（待機時間は呼び出し引数で確認する）"""
+    with patch("core.utils.decorators.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        yield sleep
+
+
 @pytest.mark.asyncio
 class TestRetryOnFailure:
     async def test_succeeds_first_try(self):
@@ -64,11 +71,11 @@ class TestRetryOnFailure:
             await wrong_type()
         assert call_count == 1  # リトライされない
 
-    async def test_backoff_increases(self):
-        """バックオフが指数的に増加する（実行時間で間接確認）"""
+    async def test_backoff_increases(self, mock_sleep):
+        """バックオフが指数的に増加する（backoff_factor ** attempt 秒待機する）"""
         call_count = 0
 
-        @retry_on_failure(max_retries=2, backoff_factor=0.05)
+        @retry_on_failure(max_retries=2, backoff_factor=2.0)
         async def slow_fail():
             nonlocal call_count
             call_count += 1
@@ -78,6 +85,7 @@ class TestRetryOnFailure:
 
         result = await slow_fail()
         assert result == "done"
+        assert mock_sleep.await_args_list == [call(1.0), call(2.0)]
 
     async def test_preserves_function_metadata(self):
         @retry_on_failure(max_retries=1, backoff_factor=0.01)
@@ -9,12 +9,10 @@ from unittest.mock import MagicMock, patch, AsyncMock
 
 import pytest
 
-# e2e_dry_run モジュールをインポート
+# e2e_dry_run モジュールをインポート（scripts/ は pytest.ini の pythonpath に含まれないので追加する）
 import sys
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from e2e_dry_run import (
     run_e2e_dry_run,
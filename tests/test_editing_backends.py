@@ -1,18 +1,11 @@
-import sys
 from pathlib import Path
 from typing import Any
 
 
-# プロジェクトルートをパスに追加
-PROJECT_ROOT = Path(__file__).parent.parent
-if str(PROJECT_ROOT / "src") not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT / "src"))
-
-from core.editing.ymm4_backend import YMM4EditingBackend  # noqa: E402
-
-
 def test_ymm4_record_export_outputs_includes_template_diff(tmp_path: Path):
     """YMM4EditingBackend が export_outputs['ymm4'] に template_diff を含めることを確認"""
+    # 収集時に編集バックエンド一式を読み込まないよう、テスト実行時にだけ import する
+    from core.editing.ymm4_backend import YMM4EditingBackend
 
     # プロジェクトディレクトリと関連ファイルを準備
     project_dir = tmp_path / "project"
@@ -7,60 +7,37 @@ Geminiスライド生成の検証テスト
 3. prefer_gemini_slide_content フラグによる分岐が正しく動作するか
 
 実行方法:
-  cmd.exe /c "venv\\Scripts\\activate.bat && set PYTHONPATH=. && python tests\\test_gemini_slides.py"
+  cmd.exe /c "venv\\Scripts\\activate.bat && set PYTHONPATH=.;src && python tests\\test_gemini_slides.py"
 """
 import asyncio
 import sys
 import os
-import pytest
+from datetime import datetime
+from functools import lru_cache
 
-# パス設定（絶対パスで解決）
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)  # config/ 用
-sys.path.insert(0, os.path.join(project_root, "src"))  # notebook_lm/, slides/ 等用
-os.chdir(project_root)
+import pytest
 
 from config.settings import settings
-from notebook_lm.transcript_processor import TranscriptInfo, TranscriptSegment
+from notebook_lm.transcript_processor import TranscriptInfo
 from slides.slide_generator import SlideGenerator
+from tests.transcript_test_data import make_segments
 
 
+# SlideGenerator は入力を変更しないので、モックは一度だけ構築して全テストで共有する
+@lru_cache(maxsize=1)
 def create_mock_transcript() -> TranscriptInfo:
     """テスト用のモックTranscriptInfoを作成"""
-    from datetime import datetime
-
-    segments = [
-        TranscriptSegment(
-            id=1,
-            start_time=0.0,
-            end_time=30.0,
-            speaker="Host",
-            text="今日はAIについて解説します。機械学習の基礎から応用まで幅広く扱います。",
-            key_points=["AI解説", "機械学習基礎"],
-            slide_suggestion="AIと機械学習の概要",
-            confidence_score=0.95,
-        ),
-        TranscriptSegment(
-            id=2,
-            start_time=30.0,
-            end_time=60.0,
-            speaker="Host",
-            text="まず、ニューラルネットワークの仕組みについて説明しましょう。",
-            key_points=["ニューラルネットワーク"],
-            slide_suggestion="ニューラルネットワークの仕組み",
-            confidence_score=0.92,
-        ),
-        TranscriptSegment(
-            id=3,
-            start_time=60.0,
-            end_time=90.0,
-            speaker="Host",
-            text="深層学習では、多層のニューラルネットワークを使用します。",
-            key_points=["深層学習", "多層ネットワーク"],
-            slide_suggestion="深層学習とは",
-            confidence_score=0.90,
-        ),
-    ]
+    segments = make_segments([
+        (1, 0.0, 30.0, "Host",
+         "今日はAIについて解説します。機械学習の基礎から応用まで幅広く扱います。",
+         ["AI解説", "機械学習基礎"], "AIと機械学習の概要", 0.95),
+        (2, 30.0, 60.0, "Host",
+         "まず、ニューラルネットワークの仕組みについて説明しましょう。",
+         ["ニューラルネットワーク"], "ニューラルネットワークの仕組み", 0.92),
+        (3, 60.0, 90.0, "Host",
+         "深層学習では、多層のニューラルネットワークを使用します。",
+         ["深層学習", "多層ネットワーク"], "深層学習とは", 0.90),
+    ])
     return TranscriptInfo(
         title="AI入門講座",
         segments=segments,
@@ -71,6 +48,7 @@ def create_mock_transcript() -> TranscriptInfo:
     )
 
 
+@lru_cache(maxsize=1)
 def create_mock_script_bundle_with_slides() -> dict:
     """Gemini由来のスライド情報を含むモックscript_bundleを作成"""
     return {
@@ -110,91 +88,59 @@ def create_mock_script_bundle_with_slides() -> dict:
 
 
 @pytest.mark.asyncio
-async def test_slide_generator_with_bundle():
-    """script_bundle付きでSlideGeneratorをテスト"""
+@pytest.mark.parametrize(
+    "script_bundle,max_slides",
+    [(create_mock_script_bundle_with_slides(), 10), (None, 5)],
+    ids=["with_bundle", "without_bundle"],
+)
+async def test_slide_generator(script_bundle, max_slides):
+    """script_bundle あり/なし（従来パス）で SlideGenerator をテスト"""
+    label = "script_bundle付き" if script_bundle is not None else "script_bundleなし（従来パス）"
     print("\n" + "=" * 60)
-    print("テスト1: script_bundle付きスライド生成")
+    print(f"テスト: {label}スライド生成")
     print("=" * 60)
 
     transcript = create_mock_transcript()
-    script_bundle = create_mock_script_bundle_with_slides()
 
-    # 設定確認
-    prefer_gemini = settings.SLIDES_SETTINGS.get("prefer_gemini_slide_content", False)
-    print(f"\n[設定] prefer_gemini_slide_content = {prefer_gemini}")
-    print(f"[入力] script_bundle['slides'] = {len(script_bundle['slides'])}枚")
+    if script_bundle is not None:
+        # 設定確認
+        prefer_gemini = settings.SLIDES_SETTINGS.get("prefer_gemini_slide_content", False)
+        print(f"\n[設定] prefer_gemini_slide_content = {prefer_gemini}")
+        n_bundle_slides = len(script_bundle["slides"])
+        print(f"[入力] script_bundle['slides'] = {n_bundle_slides}枚")
 
     generator = SlideGenerator()
 
-    try:
-        slides_pkg = await generator.generate_slides(
-            transcript=transcript,
-            max_slides=10,
-            script_bundle=script_bundle,
-        )
-
-        print(f"\n[結果] 生成されたスライド: {slides_pkg.total_slides}枚")
-        print(f"[結果] presentation_id: {slides_pkg.presentation_id}")
-        print(f"[結果] title: {slides_pkg.title}")
-
-        for i, slide in enumerate(slides_pkg.slides[:3], 1):
-            print(f"\n  スライド {i}:")
-            print(f"    タイトル: {slide.title}")
-            print(f"    内容: {slide.content[:50]}..." if len(slide.content) > 50 else f"    内容: {slide.content}")
-            print(f"    duration: {slide.estimated_duration}秒")
-            if slide.image_suggestions:
-                print(f"    画像提案: {slide.image_suggestions}")
-
-        print("\n✅ テスト1 成功")
-        return True
-
-    except Exception as e:
-        print(f"\n❌ テスト1 失敗: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-@pytest.mark.asyncio
-async def test_slide_generator_without_bundle():
-    """script_bundleなしでSlideGeneratorをテスト（従来パス）"""
-    print("\n" + "=" * 60)
-    print("テスト2: script_bundleなしスライド生成（従来パス）")
-    print("=" * 60)
-
-    transcript = create_mock_transcript()
-
-    generator = SlideGenerator()
-
-    try:
-        slides_pkg = await generator.generate_slides(
-            transcript=transcript,
-            max_slides=5,
-            script_bundle=None,
-        )
-
-        print(f"\n[結果] 生成されたスライド: {slides_pkg.total_slides}枚")
-        print(f"[結果] presentation_id: {slides_pkg.presentation_id}")
-
-        for i, slide in enumerate(slides_pkg.slides[:3], 1):
-            print(f"\n  スライド {i}:")
-            print(f"    タイトル: {slide.title}")
-
-        print("\n✅ テスト2 成功")
-        return True
+    slides_pkg = await generator.generate_slides(
+        transcript=transcript,
+        max_slides=max_slides,
+        script_bundle=script_bundle,
+    )
 
-    except Exception as e:
-        print(f"\n❌ テスト2 失敗: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    print(f"\n[結果] 生成されたスライド: {slides_pkg.total_slides}枚")
+    print(f"[結果] presentation_id: {slides_pkg.presentation_id}")
+    print(f"[結果] title: {slides_pkg.title}")
+
+    top_slides = slides_pkg.slides[:3]
+    for i, slide in enumerate(top_slides, 1):
+        content = slide.content
+        short = content if len(content) <= 50 else content[:50] + "..."
+        print(f"\n  スライド {i}:")
+        print(f"    タイトル: {slide.title}")
+        print(f"    内容: {short}")
+        print(f"    duration: {slide.estimated_duration}秒")
+        if slide.image_suggestions:
+            print(f"    画像提案: {slide.image_suggestions}")
+
+    print(f"\n✅ {label} 成功")
+    return True
 
 
 @pytest.mark.asyncio
 async def test_prefer_gemini_flag():
     """prefer_gemini_slide_content フラグの動作確認"""
     print("\n" + "=" * 60)
-    print("テスト3: prefer_gemini_slide_content フラグ確認")
+    print("テスト: prefer_gemini_slide_content フラグ確認")
     print("=" * 60)
 
     # 現在の設定値を確認
@@ -214,7 +160,7 @@ async def test_prefer_gemini_flag():
         print("    set SLIDES_USE_GEMINI_CONTENT=true")
         print("  を設定してから実行してください")
 
-    print("\n✅ テスト3 完了")
+    print("\n✅ prefer_gemini_slide_content フラグ確認 完了")
     return True
 
 
@@ -224,12 +170,18 @@ async def main():
     print("Geminiスライド生成 検証テスト")
     print("=" * 60)
 
+    # テスト実行（出力がテストごとにまとまるよう順に実行する。失敗は例外として受け取る）
     results = []
-
-    # テスト実行
-    results.append(await test_prefer_gemini_flag())
-    results.append(await test_slide_generator_with_bundle())
-    results.append(await test_slide_generator_without_bundle())
+    for test in (
+        test_prefer_gemini_flag(),
+        test_slide_generator(create_mock_script_bundle_with_slides(), 10),
+        test_slide_generator(None, 5),
+    ):
+        try:
+            results.append(await test is True)
+        except Exception as e:
+            print(f"\n❌ 失敗: {e!r}")
+            results.append(False)
 
     # 結果サマリー
     print("\n" + "=" * 60)
@@ -4,55 +4,40 @@
 CSV + 行ごと WAV から Transcript/スライド分割の可視化ロジックが最低限動くことを確認する。
 """
 
-import sys
 import wave
-import struct
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from scripts.inspect_csv_timeline import inspect_timeline  # noqa: E402
-
-
-def _create_silent_wav(path: Path, duration_sec: float = 1.0, sample_rate: int = 44100) -> None:
-    """指定秒数の無音WAVを生成"""
-    n_channels = 1
-    sampwidth = 2  # 16-bit
-    n_frames = int(sample_rate * duration_sec)
-
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with wave.open(str(path), "w") as wf:
-        wf.setnchannels(n_channels)
-        wf.setsampwidth(sampwidth)
-        wf.setframerate(sample_rate)
-        silence_frame = struct.pack("<h", 0)
-        wf.writeframes(silence_frame * n_frames)
+from scripts.inspect_csv_timeline import _probe_wav_duration, inspect_timeline
 
 
 @pytest.mark.asyncio
 async def test_inspect_csv_timeline_basic(tmp_path: Path):
     # 1) CSV 作成 (2行)
     csv_path = tmp_path / "timeline.csv"
-    csv_content = "Speaker1,こんにちは世界\nSpeaker2,テストです\n"
-    csv_path.write_text(csv_content, encoding="utf-8")
+    rows = [("Speaker1", "こんにちは世界"), ("Speaker2", "テストです")]
+    csv_path.write_text("".join(f"{speaker},{text}\n" for speaker, text in rows), encoding="utf-8")
 
-    # 2) 行ごとの音声ファイル (2本の無音WAV)
+    # 2) 行ごとの音声ファイル (中身は読まないので空ファイルで十分。長さは probe をモックして与える)
     audio_dir = tmp_path / "audio"
-    _create_silent_wav(audio_dir / "001.wav", duration_sec=1.0)
-    _create_silent_wav(audio_dir / "002.wav", duration_sec=2.0)
+    audio_dir.mkdir()
+    (audio_dir / "001.wav").touch()
+    (audio_dir / "002.wav").touch()
+    durations = {"001.wav": 1.0, "002.wav": 2.0}
 
     # 3) 可視化処理を実行（小さい max_chars_per_slide を指定して、分割挙動に影響を与える）
-    summary = await inspect_timeline(
-        csv_path=csv_path,
-        audio_dir=audio_dir,
-        max_chars_per_slide=20,
-        max_slides=10,
-    )
+    with patch(
+        "scripts.inspect_csv_timeline._probe_wav_duration",
+        side_effect=lambda p: durations[p.name],
+    ):
+        summary = await inspect_timeline(
+            csv_path=csv_path,
+            audio_dir=audio_dir,
+            max_chars_per_slide=20,
+            max_slides=10,
+        )
 
     transcript = summary["transcript"]
     slides = summary["slide_contents"]
@@ -68,3 +53,15 @@ async def test_inspect_csv_timeline_basic(tmp_path: Path):
 
     # max_chars_per_slide が stats に反映されていること
     assert stats["max_chars_per_slide"] == 20
+
+
+def test_probe_wav_duration_reads_wav_header(tmp_path: Path):
+    # 8000Hz / 16bit モノラルで 0.5 秒分の無音 WAV を書き出す
+    wav_path = tmp_path / "short.wav"
+    with wave.open(str(wav_path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(8000)
+        wf.writeframes(b"\x00\x00" * 4000)
+
+    assert _probe_wav_duration(wav_path) == pytest.approx(0.5)
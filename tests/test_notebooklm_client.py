@@ -5,15 +5,10 @@
 notebooklm-py は未インストール環境でも MockNLMClient で動作することを検証する。
 """
 import asyncio
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
 from notebook_lm.notebooklm_client import NotebookLMClient, NLMNotebook, NLMStudyGuide, NLMSlides
 from notebook_lm.nlm_script_converter import NlmScriptConverter
 from notebook_lm.gemini_integration import ScriptInfo
@@ -5,72 +5,53 @@
 """
 
 import pytest
-from pathlib import Path
-import sys
-
-# プロジェクトルートをパスに追加
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
+from inspect import iscoroutinefunction
 
 from src.core.providers.script.gemini_provider import GeminiScriptProvider
 from src.core.editing.ymm4_backend import YMM4EditingBackend
 from src.core.platforms.youtube_adapter import YouTubePlatformAdapter
 from src.core.timeline.basic_planner import BasicTimelinePlanner
+from src.core.interfaces import (
+    IEditingBackend,
+    IPlatformAdapter,
+    IScriptProvider,
+    ITimelinePlanner,
+)
+
+# (実装クラス, OpenSpecインターフェースのメソッド名)
+_IFACE_CASES = [
+    (GeminiScriptProvider, 'generate_script'),  # IScriptProvider
+    (YMM4EditingBackend, 'render'),  # IEditingBackend
+    (YouTubePlatformAdapter, 'upload'),  # IPlatformAdapter
+    (BasicTimelinePlanner, 'build_plan'),  # ITimelinePlanner
+]
+
+# (実装クラス, 準拠すべき runtime_checkable Protocol)
+_PROTOCOL_CASES = [
+    (GeminiScriptProvider, IScriptProvider),
+    (YMM4EditingBackend, IEditingBackend),
+    (YouTubePlatformAdapter, IPlatformAdapter),
+    (BasicTimelinePlanner, ITimelinePlanner),
+]
+
 
 class TestOpenSpecInterfaces:
     """OpenSpecインターフェース準拠テスト"""
 
-    @pytest.mark.asyncio
-    async def test_gemini_script_provider_interface(self):
-        """GeminiScriptProviderがIScriptProviderインターフェースを実装しているか"""
-        provider = GeminiScriptProvider()
-
-        # IScriptProviderのメソッドが存在するか確認
-        assert hasattr(provider, 'generate_script')
-        assert callable(getattr(provider, 'generate_script'))
+    @pytest.mark.parametrize(
+        "cls,method",
+        _IFACE_CASES,
+        ids=[cls.__name__ for cls, _ in _IFACE_CASES],
+    )
+    def test_interface(self, cls, method):
+        """各実装クラスが対応するインターフェースのメソッドを実装しているか"""
+        # 構造的な準拠はクラス属性で確認できるので、インスタンスは生成しない
+        assert hasattr(cls, method)
+        assert callable(getattr(cls, method))
 
         # メソッドがasync関数であることを確認
-        import inspect
-        assert inspect.iscoroutinefunction(provider.generate_script)
+        assert iscoroutinefunction(getattr(cls, method))
 
-    @pytest.mark.asyncio
-    async def test_ymm4_editing_backend_interface(self):
-        """YMM4EditingBackendがIEditingBackendインターフェースを実装しているか"""
-        backend = YMM4EditingBackend()
-
-        # IEditingBackendのメソッドが存在するか確認
-        assert hasattr(backend, 'render')
-        assert callable(getattr(backend, 'render'))
-
-        # メソッドがasync関数であることを確認
-        import inspect
-        assert inspect.iscoroutinefunction(backend.render)
-
-    @pytest.mark.asyncio
-    async def test_youtube_platform_adapter_interface(self):
-        """YouTubePlatformAdapterがIPlatformAdapterインターフェースを実装しているか"""
-        adapter = YouTubePlatformAdapter()
-
-        # IPlatformAdapterのメソッドが存在するか確認
-        assert hasattr(adapter, 'upload')
-        assert callable(getattr(adapter, 'upload'))
-
-        # メソッドがasync関数であることを確認
-        import inspect
-        assert inspect.iscoroutinefunction(adapter.upload)
-
-    @pytest.mark.asyncio
-    async def test_basic_timeline_planner_interface(self):
-        """BasicTimelinePlannerがITimelinePlannerインターフェースを実装しているか"""
-        planner = BasicTimelinePlanner()
-
-        # ITimelinePlannerのメソッドが存在するか確認
-        assert hasattr(planner, 'build_plan')
-        assert callable(getattr(planner, 'build_plan'))
-
-        # メソッドがasync関数であることを確認
-        import inspect
-        assert inspect.iscoroutinefunction(planner.build_plan)
 
 class TestInterfaceCompliance:
     """インターフェース準拠の詳細テスト"""
@@ -78,24 +59,16 @@ class TestInterfaceCompliance:
     def test_interface_inheritance(self):
         """各実装クラスが適切なインターフェースを継承しているか"""
         # Protocolは継承ではなく構造的サブタイピングなので、
-        # メソッドシグネチャの一致を確認
-
-        # GeminiScriptProvider
-        provider = GeminiScriptProvider()
-        assert hasattr(provider, 'generate_script')
-
-        # YouTubePlatformAdapter
-        adapter = YouTubePlatformAdapter()
-        assert hasattr(adapter, 'upload')
+        # runtime_checkable Protocol に対する issubclass でメンバーの一致を確認
+        for cls, protocol in _PROTOCOL_CASES:
+            assert issubclass(cls, protocol), f"{cls.__name__} does not satisfy {protocol.__name__}"
 
     def test_method_signatures(self):
-        """メソッドのシグネチャがインターフェースと一致するか"""
-        import inspect
-
+        """メソッドのシグネチャがインターフェースと一致するか（引数名のずれを検出）"""
         # GeminiScriptProvider.generate_script
-        provider = GeminiScriptProvider()
-        sig = inspect.signature(provider.generate_script)
-        params = list(sig.parameters.keys())
+        # 引数名の有無だけを見るので、Signature を組み立てずにコードオブジェクトから読む
+        code = GeminiScriptProvider.generate_script.__code__
+        params = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
 
         # IScriptProvider.generate_scriptの期待されるパラメータ
         expected_params = ['topic', 'sources', 'mode']
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -70,6 +69,12 @@ def planner():
     return OverlayPlanner()
 
 
+@pytest.fixture(scope="module")
+def scratch_dir(tmp_path_factory) -> Path:
+    """Output directory shared by the save tests (each test writes its own path)."""
+    return tmp_path_factory.mktemp("overlay_output")
+
+
 # ---- Tests ----
 
 
@@ -182,7 +187,7 @@ class TestOverlayPlan:
         assert d["overlays"][0]["type"] == "chapter_title"
         assert d["overlays"][0]["text"] == "導入"
 
-    def test_save_and_load(self):
+    def test_save_and_load(self, scratch_dir: Path):
         plan = OverlayPlan(
             overlays=[
                 OverlayEntry(
@@ -194,22 +199,20 @@ class TestOverlayPlan:
                 )
             ]
         )
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "overlay_plan.json"
-            plan.save(path)
+        path = scratch_dir / "overlay_plan.json"
+        plan.save(path)
 
-            assert path.exists()
-            data = json.loads(path.read_text(encoding="utf-8"))
-            assert data["version"] == "1.0"
-            assert len(data["overlays"]) == 1
-            assert data["overlays"][0]["text"] == "テストポイント"
+        assert path.exists()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["version"] == "1.0"
+        assert len(data["overlays"]) == 1
+        assert data["overlays"][0]["text"] == "テストポイント"
 
-    def test_save_creates_parent_dirs(self):
+    def test_save_creates_parent_dirs(self, scratch_dir: Path):
         plan = OverlayPlan(overlays=[])
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "sub" / "deep" / "overlay_plan.json"
-            plan.save(path)
-            assert path.exists()
+        path = scratch_dir / "sub" / "deep" / "overlay_plan.json"
+        plan.save(path)
+        assert path.exists()
 
 
 class TestStatisticsDetection:
@@ -8,25 +8,34 @@ import pytest
 from unittest.mock import Mock, AsyncMock
 from pathlib import Path
 from datetime import datetime
-import sys
-
-# プロジェクトルートをパスに追加
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
+from types import SimpleNamespace
 
 from src.core.platforms.youtube_adapter import YouTubePlatformAdapter
 from video_editor.models import VideoInfo
 from youtube.uploader import UploadMetadata
 
+# VideoInfo.created_at 用の固定時刻（テストごとに時計を読まず、比較も決定的にする）
+_FIXED_NOW = datetime(2024, 1, 1)
+
+
 class TestYouTubePlatformAdapter:
     """YouTubePlatformAdapterのテスト"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def adapter(self):
-        """テスト用のアダプターインスタンス"""
+        """テスト用のアダプターインスタンス（モジュール内で共有）"""
         return YouTubePlatformAdapter()
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def _reset_adapter(self, adapter):
+        """共有アダプターの可変状態をテストごとに初期化する（認証は常に成功させる）"""
+        adapter.uploader = Mock(
+            authenticate=AsyncMock(return_value=True),
+            upload_video=AsyncMock(),
+        )
+        adapter._authenticated = False
+
+    @pytest.fixture(scope="module")
     def mock_video_info(self):
         """モック動画情報"""
         return VideoInfo(
@@ -37,12 +46,12 @@ class TestYouTubePlatformAdapter:
             file_size=10000000,
             has_subtitles=True,
             has_effects=True,
-            created_at=datetime.now()
+            created_at=_FIXED_NOW
         )
 
-    @pytest.fixture
-    def mock_metadata(self):
-        """モックアップロードメタデータ"""
+    @pytest.fixture(scope="module")
+    def _shared_metadata(self):
+        """モックアップロードメタデータ（モジュール内で共有）"""
         return UploadMetadata(
             title="テスト動画",
             description="これはテスト動画です。",
@@ -52,17 +61,22 @@ class TestYouTubePlatformAdapter:
             privacy_status="private"
         )
 
-    @pytest.mark.asyncio
+    @pytest.fixture
+    def mock_metadata(self, _shared_metadata):
+        """モックアップロードメタデータ（スケジュール投稿で書き換わる publish_at は毎回戻す）"""
+        _shared_metadata.publish_at = None
+        return _shared_metadata
+
     async def test_upload_basic(self, adapter, mock_video_info, mock_metadata):
         """基本的なアップロードテスト"""
         # Uploaderインスタンスのメソッドをモック
-        mock_result = Mock()
-        mock_result.video_url = "https://youtube.com/watch?v=test123"
-        mock_result.video_id = "test123"
-        mock_result.upload_status = "uploaded"
+        mock_result = SimpleNamespace(
+            video_url="https://youtube.com/watch?v=test123",
+            video_id="test123",
+            upload_status="uploaded",
+        )
 
-        adapter.uploader.authenticate = AsyncMock(return_value=True)
-        adapter.uploader.upload_video = AsyncMock(return_value=mock_result)
+        adapter.uploader.upload_video.return_value = mock_result
 
         result = await adapter.upload(mock_video_info, mock_metadata)
 
@@ -70,29 +84,26 @@ class TestYouTubePlatformAdapter:
         assert result["video_id"] == "test123"
         adapter.uploader.upload_video.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_upload_with_schedule(self, adapter, mock_video_info, mock_metadata):
         """スケジュール付きアップロードテスト"""
         schedule_time = datetime(2025, 12, 31, 12, 0, 0)
 
-        mock_result = Mock()
-        mock_result.video_url = "https://youtube.com/watch?v=scheduled_test"
-        mock_result.video_id = "scheduled_test"
-        mock_result.upload_status = "scheduled"
+        mock_result = SimpleNamespace(
+            video_url="https://youtube.com/watch?v=scheduled_test",
+            video_id="scheduled_test",
+            upload_status="scheduled",
+        )
 
-        adapter.uploader.authenticate = AsyncMock(return_value=True)
-        adapter.uploader.upload_video = AsyncMock(return_value=mock_result)
+        adapter.uploader.upload_video.return_value = mock_result
 
         result = await adapter.upload(mock_video_info, mock_metadata, schedule=schedule_time)
 
         assert result["url"] == "https://youtube.com/watch?v=scheduled_test"
         adapter.uploader.upload_video.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_upload_api_error(self, adapter, mock_video_info, mock_metadata):
         """APIエラー時の処理テスト"""
-        adapter.uploader.authenticate = AsyncMock(return_value=True)
-        adapter.uploader.upload_video = AsyncMock(side_effect=Exception("YouTube API Error"))
+        adapter.uploader.upload_video.side_effect = Exception("YouTube API Error")
 
         with pytest.raises(Exception):
             await adapter.upload(mock_video_info, mock_metadata)
@@ -102,16 +113,15 @@ class TestYouTubePlatformAdapter:
         assert adapter is not None
         assert hasattr(adapter, 'upload')
 
-    @pytest.mark.asyncio
     async def test_upload_result_structure(self, adapter, mock_video_info, mock_metadata):
         """アップロード結果の構造テスト"""
-        mock_result = Mock()
-        mock_result.video_url = "https://youtube.com/watch?v=structured_test"
-        mock_result.video_id = "structured_test"
-        mock_result.upload_status = "uploaded"
+        mock_result = SimpleNamespace(
+            video_url="https://youtube.com/watch?v=structured_test",
+            video_id="structured_test",
+            upload_status="uploaded",
+        )
 
-        adapter.uploader.authenticate = AsyncMock(return_value=True)
-        adapter.uploader.upload_video = AsyncMock(return_value=mock_result)
+        adapter.uploader.upload_video.return_value = mock_result
 
         result = await adapter.upload(mock_video_info, mock_metadata)
 
@@ -119,33 +129,31 @@ class TestYouTubePlatformAdapter:
         assert "video_id" in result
         assert "success" in result
 
-    @pytest.mark.asyncio
-    async def test_different_privacy_settings(self, adapter, mock_video_info):
+    @pytest.mark.parametrize("privacy", ['public', 'private', 'unlisted'])
+    async def test_different_privacy_settings(self, adapter, mock_video_info, privacy):
         """異なるプライバシー設定でのアップロードテスト"""
-        for privacy in ['public', 'private', 'unlisted']:
-            metadata = UploadMetadata(
-                title=f"{privacy}テスト動画",
-                description=f"{privacy}設定のテスト動画です。",
-                tags=["テスト", privacy],
-                category_id="22",
-                language="ja",
-                privacy_status=privacy
-            )
-
-            mock_result = Mock()
-            mock_result.video_url = f"https://youtube.com/watch?v={privacy}_test"
-            mock_result.video_id = f"{privacy}_test"
-            mock_result.upload_status = "uploaded"
-
-            adapter.uploader.authenticate = AsyncMock(return_value=True)
-            adapter.uploader.upload_video = AsyncMock(return_value=mock_result)
-            adapter._authenticated = False  # 認証状態をリセット
-
-            result = await adapter.upload(mock_video_info, metadata)
-
-            assert result["video_id"] == f"{privacy}_test"
-
-    @pytest.mark.asyncio
+        metadata = UploadMetadata(
+            title=f"{privacy}テスト動画",
+            description=f"{privacy}設定のテスト動画です。",
+            tags=["テスト", privacy],
+            category_id="22",
+            language="ja",
+            privacy_status=privacy
+        )
+
+        mock_result = SimpleNamespace(
+            video_url=f"https://youtube.com/watch?v={privacy}_test",
+            video_id=f"{privacy}_test",
+            upload_status="uploaded",
+        )
+
+        adapter.uploader.upload_video.return_value = mock_result
+
+        result = await adapter.upload(mock_video_info, metadata)
+
+        assert result["video_id"] == f"{privacy}_test"
+        adapter.uploader.upload_video.assert_awaited_once()
+
     async def test_video_file_validation(self, adapter, mock_metadata):
         """動画ファイルのバリデーションテスト"""
         invalid_video = VideoInfo(
@@ -156,16 +164,14 @@ class TestYouTubePlatformAdapter:
             file_size=0,
             has_subtitles=False,
             has_effects=False,
-            created_at=datetime.now()
+            created_at=_FIXED_NOW
         )
 
-        adapter.uploader.authenticate = AsyncMock(return_value=True)
-        adapter.uploader.upload_video = AsyncMock(side_effect=FileNotFoundError("Video file not found"))
+        adapter.uploader.upload_video.side_effect = FileNotFoundError("Video file not found")
 
         with pytest.raises(FileNotFoundError):
             await adapter.upload(invalid_video, mock_metadata)
 
-    @pytest.mark.asyncio
     async def test_metadata_validation(self, adapter, mock_video_info):
         """メタデータのバリデーションテスト"""
         invalid_metadata = UploadMetadata(
@@ -177,8 +183,7 @@ class TestYouTubePlatformAdapter:
             privacy_status="invalid_status"
         )
 
-        adapter.uploader.authenticate = AsyncMock(return_value=True)
-        adapter.uploader.upload_video = AsyncMock(side_effect=ValueError("Invalid metadata"))
+        adapter.uploader.upload_video.side_effect = ValueError("Invalid metadata")
 
         with pytest.raises(ValueError):
             await adapter.upload(mock_video_info, invalid_metadata)
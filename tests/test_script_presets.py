@@ -4,10 +4,6 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Import target
-import sys
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
 from notebook_lm.gemini_integration import GeminiIntegration
 
 
@@ -6,19 +6,13 @@
 
 from __future__ import annotations
 
-import sys
 import wave
-import struct
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from scripts.split_audio_by_silence import split_audio_by_silence  # noqa: E402
+from scripts.split_audio_by_silence import split_audio_by_silence
 
 
 def _create_pattern_wav(
@@ -33,16 +27,16 @@ def _create_pattern_wav(
     """
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    # 区間ごとの振幅をフレーム数だけ繰り返した16-bitバッファを一度に組み立てる
+    values = np.clip([amp for _, amp in pattern], -32768, 32767).astype("<i2")
+    counts = [int(sample_rate * duration_sec) for duration_sec, _ in pattern]
+    samples = np.repeat(values, counts)
+
     with wave.open(str(path), "w") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)  # 16-bit
         wf.setframerate(sample_rate)
-
-        for duration_sec, amp in pattern:
-            n_frames = int(sample_rate * duration_sec)
-            value = max(min(amp, 32767), -32768)
-            frame = struct.pack("<h", value)
-            wf.writeframes(frame * n_frames)
+        wf.writeframes(samples.tobytes())
 
 
 @pytest.mark.parametrize(
@@ -464,20 +464,20 @@ class TestQueryTranslation:
         assert not _JAPANESE_RE.search("technology")
         assert not _JAPANESE_RE.search("AI 2024")
 
-    def test_translate_fallback_on_no_api_key(self, tmp_path: Path) -> None:
+    def test_translate_fallback_on_no_api_key(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Gemini APIキーなし → 元のクエリを返す"""
         client = StockImageClient(
             pexels_api_key="", pixabay_api_key="",
             cache_dir=tmp_path / "cache",
         )
         queries = ["量子コンピュータ", "technology"]
-        with patch.dict("os.environ", {"GEMINI_API_KEY": ""}, clear=False):
-            with patch("core.visual.stock_image_client.settings") as mock_settings:
-                mock_settings.GEMINI_API_KEY = ""
-                result = client._translate_queries_to_english(queries)
+        monkeypatch.setenv("GEMINI_API_KEY", "")
+        with patch("core.visual.stock_image_client.settings") as mock_settings:
+            mock_settings.GEMINI_API_KEY = ""
+            result = client._translate_queries_to_english(queries)
         assert result == queries
 
-    def test_translate_with_mock_gemini(self, client: StockImageClient) -> None:
+    def test_translate_with_mock_gemini(self, client: StockImageClient, monkeypatch: pytest.MonkeyPatch) -> None:
         """Gemini翻訳のモックテスト"""
         queries = ["量子コンピュータ", "technology", "深層学習"]
 
@@ -487,15 +487,15 @@ class TestQueryTranslation:
         mock_client_instance = MagicMock()
         mock_client_instance.models.generate_content.return_value = mock_response
 
-        with patch.dict("os.environ", {"GEMINI_API_KEY": "test_key"}, clear=False):
-            with patch("google.genai.Client", return_value=mock_client_instance):
-                result = client._translate_queries_to_english(queries)
+        monkeypatch.setenv("GEMINI_API_KEY", "test_key")
+        with patch("google.genai.Client", return_value=mock_client_instance):
+            result = client._translate_queries_to_english(queries)
 
         assert result[0] == "quantum computer"
         assert result[1] == "technology"  # 英語はそのまま
         assert result[2] == "deep learning"
 
-    def test_mixed_japanese_english(self, client: StockImageClient) -> None:
+    def test_mixed_japanese_english(self, client: StockImageClient, monkeypatch: pytest.MonkeyPatch) -> None:
         """日本語と英語混在のクエリリスト"""
         queries = ["AI revolution", "量子ビット", "cloud computing"]
         # 英語のみ (index 0, 2) は翻訳スキップ
@@ -506,9 +506,9 @@ class TestQueryTranslation:
         mock_client_instance = MagicMock()
         mock_client_instance.models.generate_content.return_value = mock_response
 
-        with patch.dict("os.environ", {"GEMINI_API_KEY": "test_key"}, clear=False):
-            with patch("google.genai.Client", return_value=mock_client_instance):
-                result = client._translate_queries_to_english(queries)
+        monkeypatch.setenv("GEMINI_API_KEY", "test_key")
+        with patch("google.genai.Client", return_value=mock_client_instance):
+            result = client._translate_queries_to_english(queries)
 
         assert result[0] == "AI revolution"
         assert result[1] == "quantum bit"
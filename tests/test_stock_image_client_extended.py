@@ -960,15 +960,15 @@ class TestBuildQueryEdgeCases:
 class TestTranslateEdgeCases:
     """翻訳エッジケース。"""
 
-    def test_gemini_exception_returns_original(self, client: StockImageClient) -> None:
+    def test_gemini_exception_returns_original(self, client: StockImageClient, monkeypatch: pytest.MonkeyPatch) -> None:
         """Gemini呼び出し例外 → 元のクエリを返す (lines 444-446)。"""
         queries = ["量子コンピュータ", "AI"]
-        with patch.dict("os.environ", {"GEMINI_API_KEY": "test_key"}, clear=False):
-            with patch("google.genai.Client", side_effect=RuntimeError("API down")):
-                result = client._translate_queries_to_english(queries)
+        monkeypatch.setenv("GEMINI_API_KEY", "test_key")
+        with patch("google.genai.Client", side_effect=RuntimeError("API down")):
+            result = client._translate_queries_to_english(queries)
         assert result == queries
 
-    def test_gemini_empty_response(self, client: StockImageClient) -> None:
+    def test_gemini_empty_response(self, client: StockImageClient, monkeypatch: pytest.MonkeyPatch) -> None:
         """Geminiレスポンスが空 → 元のクエリを返す。"""
         queries = ["深層学習"]
         mock_response = MagicMock()
@@ -976,13 +976,13 @@ class TestTranslateEdgeCases:
         mock_client = MagicMock()
         mock_client.models.generate_content.return_value = mock_response
 
-        with patch.dict("os.environ", {"GEMINI_API_KEY": "test_key"}, clear=False):
-            with patch("google.genai.Client", return_value=mock_client):
-                result = client._translate_queries_to_english(queries)
+        monkeypatch.setenv("GEMINI_API_KEY", "test_key")
+        with patch("google.genai.Client", return_value=mock_client):
+            result = client._translate_queries_to_english(queries)
         # 空レスポンス → 翻訳行なし → 元のクエリが残る
         assert result[0] == "深層学習"
 
-    def test_gemini_none_text(self, client: StockImageClient) -> None:
+    def test_gemini_none_text(self, client: StockImageClient, monkeypatch: pytest.MonkeyPatch) -> None:
         """Gemini response.text が None → 空文字扱い。"""
         queries = ["機械学習"]
         mock_response = MagicMock()
@@ -990,9 +990,9 @@ class TestTranslateEdgeCases:
         mock_client = MagicMock()
         mock_client.models.generate_content.return_value = mock_response
 
-        with patch.dict("os.environ", {"GEMINI_API_KEY": "test_key"}, clear=False):
-            with patch("google.genai.Client", return_value=mock_client):
-                result = client._translate_queries_to_english(queries)
+        monkeypatch.setenv("GEMINI_API_KEY", "test_key")
+        with patch("google.genai.Client", return_value=mock_client):
+            result = client._translate_queries_to_english(queries)
         assert result[0] == "機械学習"
 
     def test_all_empty_queries_skip_translation(self, client: StockImageClient) -> None:
@@ -1001,7 +1001,7 @@ class TestTranslateEdgeCases:
         result = client._translate_queries_to_english(queries)
         assert result == queries
 
-    def test_gemini_partial_response(self, client: StockImageClient) -> None:
+    def test_gemini_partial_response(self, client: StockImageClient, monkeypatch: pytest.MonkeyPatch) -> None:
         """Geminiが一部だけ翻訳を返す → 返された分だけ適用。"""
         queries = ["量子力学", "technology", "生物学", "chemistry"]
         # japanese_indices = [0, 2]
@@ -1011,9 +1011,9 @@ class TestTranslateEdgeCases:
         mock_client = MagicMock()
         mock_client.models.generate_content.return_value = mock_response
 
-        with patch.dict("os.environ", {"GEMINI_API_KEY": "test_key"}, clear=False):
-            with patch("google.genai.Client", return_value=mock_client):
-                result = client._translate_queries_to_english(queries)
+        monkeypatch.setenv("GEMINI_API_KEY", "test_key")
+        with patch("google.genai.Client", return_value=mock_client):
+            result = client._translate_queries_to_english(queries)
         assert result[0] == "quantum mechanics"
         assert result[1] == "technology"
         assert result[2] == "生物学"  # 未翻訳のまま
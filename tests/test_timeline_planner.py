@@ -1,19 +1,11 @@
-import sys
-from pathlib import Path
 from types import SimpleNamespace
 
-import asyncio
 import pytest
 
-# プロジェクトルートをパスに追加
-PROJECT_ROOT = Path(__file__).parent.parent
-if str(PROJECT_ROOT / "src") not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+from core.timeline.basic_planner import BasicTimelinePlanner
 
-from core.timeline.basic_planner import BasicTimelinePlanner  # noqa: E402
 
-
-def test_basic_timeline_plan_alignment():
+async def test_basic_timeline_plan_alignment():
     planner = BasicTimelinePlanner()
     audio = SimpleNamespace(duration=120.0)
     script = {
@@ -24,7 +16,7 @@ def test_basic_timeline_plan_alignment():
         ]
     }
 
-    plan = asyncio.run(planner.build_plan(script=script, audio=audio))
+    plan = await planner.build_plan(script=script, audio=audio)
 
     assert plan["total_duration"] == pytest.approx(120.0)
     assert len(plan["segments"]) == 3
@@ -33,11 +25,11 @@ def test_basic_timeline_plan_alignment():
     assert plan["segments"][-1]["end"] == pytest.approx(120.0)
 
 
-def test_basic_timeline_plan_fallback_segment():
+async def test_basic_timeline_plan_fallback_segment():
     planner = BasicTimelinePlanner(default_segment_duration=15.0)
     audio = SimpleNamespace(duration=0.0)
 
-    plan = asyncio.run(planner.build_plan(script={}, audio=audio))
+    plan = await planner.build_plan(script={}, audio=audio)
 
     assert plan["total_duration"] == pytest.approx(15.0)
     assert len(plan["segments"]) == 1
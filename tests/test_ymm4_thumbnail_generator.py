@@ -5,21 +5,18 @@
 
 import json
 import pytest
-import tempfile
+import shutil
 from pathlib import Path
-import sys
 
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
+from core.thumbnails.ymm4_thumbnail_generator import Ymm4ThumbnailGenerator
 
-from src.core.thumbnails.ymm4_thumbnail_generator import Ymm4ThumbnailGenerator
+project_root = Path(__file__).parent.parent
 
 
-@pytest.fixture
-def sample_template_dir(tmp_path: Path) -> Path:
-    """サンプルテンプレートを一時ディレクトリに作成する。"""
-    tmpl_dir = tmp_path / "templates"
-    tmpl_dir.mkdir()
+@pytest.fixture(scope="module")
+def sample_template_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """サンプルテンプレートを一時ディレクトリに作成する（読み取り専用としてモジュール内で共有）。"""
+    tmpl_dir = tmp_path_factory.mktemp("templates")
 
     template = {
         "FilePath": "",
@@ -69,7 +66,7 @@ def sample_template_dir(tmp_path: Path) -> Path:
     return tmpl_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generator(sample_template_dir: Path) -> Ymm4ThumbnailGenerator:
     return Ymm4ThumbnailGenerator(template_dir=sample_template_dir)
 
@@ -280,13 +277,15 @@ class TestYmm4ThumbnailAssetCopy:
 
     def test_copy_assets(self, sample_template_dir: Path, tmp_path: Path):
         """テンプレート付随素材がコピーされる"""
-        # テンプレートと同名のディレクトリに素材を配置
-        assets_dir = sample_template_dir / "test_template"
+        # 共有テンプレートを汚さないよう、コピーしたディレクトリに素材を配置
+        tmpl_dir = tmp_path / "templates"
+        shutil.copytree(sample_template_dir, tmpl_dir)
+        assets_dir = tmpl_dir / "test_template"
         assets_dir.mkdir()
         (assets_dir / "overlay.png").write_bytes(b"fake png data")
         (assets_dir / "frame.png").write_bytes(b"fake frame data")
 
-        gen = Ymm4ThumbnailGenerator(template_dir=sample_template_dir)
+        gen = Ymm4ThumbnailGenerator(template_dir=tmpl_dir)
         output_dir = tmp_path / "output"
         gen.generate(
             template_name="test_template",
@@ -351,7 +350,7 @@ class TestYmm4ThumbnailColorPreset:
 
     def test_all_presets_valid(self, generator: Ymm4ThumbnailGenerator, tmp_path: Path):
         """全5プリセットが適用可能"""
-        from src.core.thumbnails.ymm4_thumbnail_generator import COLOR_PRESETS
+        from core.thumbnails.ymm4_thumbnail_generator import COLOR_PRESETS
         for preset_name in COLOR_PRESETS:
             output_dir = tmp_path / f"output_{preset_name}"
             result = generator.generate(
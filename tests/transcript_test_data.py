@@ -0,0 +1,22 @@
+"""
+台本テスト用データ
+"""
+from notebook_lm.transcript_processor import TranscriptSegment
+
+# make_segments に渡すタプルの並び順
+_SEG_FIELDS = (
+    "id",
+    "start_time",
+    "end_time",
+    "speaker",
+    "text",
+    "key_points",
+    "slide_suggestion",
+    "confidence_score",
+)
+
+
+def make_segments(rows):
+    """(id, start_time, end_time, speaker, text, key_points, slide_suggestion, confidence_score)
+    のタプル列から TranscriptSegment のリストを作成"""
+    return [TranscriptSegment(**dict(zip(_SEG_FIELDS, row, strict=True))) for row in rows]